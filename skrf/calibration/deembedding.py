@@ -58,20 +58,239 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Literal, Sequence
 
 import numpy as np
-from numpy import angle, concatenate, conj, exp, flip, imag, ndarray, real, unwrap, zeros
-from numpy.fft import fft, fftshift, ifftshift, irfft
+from numpy import angle, concatenate, conj, exp, flip, imag, ndarray, real, zeros
 from numpy.linalg import norm
-from scipy.interpolate import interp1d
+from scipy.fft import fft, fftshift, ifftshift, irfft, rfft
+from scipy.interpolate import CubicSpline, interp1d
 
+from ..constants import ZERO
 from ..frequency import Frequency
-from ..network import Network, concat_ports, overlap_multi, subnetwork
+from ..network import Network, a2s, concat_ports, overlap_multi, s2a, s2s, s2y, s2z, subnetwork, y2s, z2a, z2s
 from ..util import Axes, Figure, figure, subplots
 
 PortOrderT = Literal["first", "second", "third"]
 
+
+def _batch_inv2x2(m: ndarray) -> ndarray:
+    """
+    Closed-form inverse of a stack of 2x2 matrices.
+    """
+    a, b, c, d = m[..., 0, 0], m[..., 0, 1], m[..., 1, 0], m[..., 1, 1]
+    inv_det = 1 / (a * d - b * c)
+    inv = np.empty_like(m)
+    np.multiply(d, inv_det, out=inv[..., 0, 0])
+    np.multiply(-b, inv_det, out=inv[..., 0, 1])
+    np.multiply(-c, inv_det, out=inv[..., 1, 0])
+    np.multiply(a, inv_det, out=inv[..., 1, 1])
+    return inv
+
+
+def _batch_matmul2x2(m1: ndarray, m2: ndarray) -> ndarray:
+    """
+    Closed-form product of two stacks of 2x2 matrices.
+
+    Unrolling the product is much faster than `np.matmul` for many small
+    matrices.
+    """
+    a1, b1, c1, d1 = m1[..., 0, 0], m1[..., 0, 1], m1[..., 1, 0], m1[..., 1, 1]
+    a2, b2, c2, d2 = m2[..., 0, 0], m2[..., 0, 1], m2[..., 1, 0], m2[..., 1, 1]
+    out = np.empty(np.broadcast_shapes(m1.shape, m2.shape), dtype=np.result_type(m1, m2))
+    out[..., 0, 0] = a1 * a2 + b1 * c2
+    out[..., 0, 1] = a1 * b2 + b1 * d2
+    out[..., 1, 0] = c1 * a2 + d1 * c2
+    out[..., 1, 1] = c1 * b2 + d1 * d2
+    return out
+
+
+def _s2t(s: ndarray) -> ndarray:
+    """
+    Closed-form cascading parameters of a stack of 2-port s-parameters.
+
+    Same convention as :func:`~skrf.network.s2t`, without its loop over
+    frequencies.
+    """
+    s11, s12, s21, s22 = s[..., 0, 0], s[..., 0, 1], s[..., 1, 0], s[..., 1, 1]
+    t = np.empty_like(s)
+    t[..., 0, 0] = (s12 * s21 - s11 * s22) / s21
+    t[..., 0, 1] = s11 / s21
+    t[..., 1, 0] = -s22 / s21
+    t[..., 1, 1] = 1 / s21
+    return t
+
+
+def _t2s(t: ndarray) -> ndarray:
+    """
+    Closed-form inverse of :func:`_s2t`.
+    """
+    t11, t12, t21, t22 = t[..., 0, 0], t[..., 0, 1], t[..., 1, 0], t[..., 1, 1]
+    s = np.empty_like(t)
+    s[..., 0, 0] = t12 / t22
+    s[..., 0, 1] = (t11 * t22 - t12 * t21) / t22
+    s[..., 1, 0] = 1 / t22
+    s[..., 1, 1] = -t21 / t22
+    return s
+
+
+def _power_s(num: ndarray, den: ndarray, z0: ndarray) -> ndarray:
+    """
+    Power-wave s-parameters F @ num @ inv(den) @ inv(F) of 2-port networks.
+
+    F is the diagonal matrix 1 / (2 * sqrt(Re(z0))).
+    """
+    sqrt_r = np.sqrt(z0.real)
+    s = _batch_matmul2x2(num, _batch_inv2x2(den))
+    s *= sqrt_r[:, None, :] / sqrt_r[:, :, None]
+    return s
+
+
+def _y2s(y: ndarray, z0: ndarray, s_def: str) -> ndarray:
+    """
+    Convert 2-port admittance parameters to s-parameters.
+
+    Power-waves are computed in closed form, the other definitions use
+    :func:`~skrf.network.y2s`.
+    """
+    if s_def != 'power':
+        return y2s(y, z0, s_def)
+    z0 = z0.astype(complex)
+    z0[z0.real == 0] += ZERO
+    num = -conj(z0)[:, :, None] * y
+    den = z0[:, :, None] * y
+    for i in range(2):
+        num[:, i, i] += 1
+        den[:, i, i] += 1
+    return _power_s(num, den, z0)
+
+
+def _z2s(z: ndarray, z0: ndarray, s_def: str) -> ndarray:
+    """
+    Convert 2-port impedance parameters to s-parameters.
+
+    Power-waves are computed in closed form, the other definitions use
+    :func:`~skrf.network.z2s`.
+    """
+    if s_def != 'power':
+        return z2s(z, z0, s_def)
+    z0 = z0.astype(complex)
+    z0[z0.real == 0] += ZERO
+    num = z.astype(complex)
+    den = z.astype(complex)
+    for i in range(2):
+        num[:, i, i] -= conj(z0[:, i])
+        den[:, i, i] += z0[:, i]
+    return _power_s(num, den, z0)
+
+
+def _continuous_sign(r: ndarray) -> ndarray:
+    """
+    Flip the sign of the samples of `r` to avoid 180° phase jumps.
+
+    Sample i is flipped if -r[i] is closer than r[i] to the previous,
+    possibly flipped, sample. The flips are accumulated with a cumulative
+    product; a tie never flips and restarts the accumulation.
+    """
+    plus = np.abs(r[1:] + r[:-1])
+    minus = np.abs(r[1:] - r[:-1])
+    flips = np.ones(len(r))
+    flips[1:][plus < minus] = -1
+    sign = np.cumprod(flips)
+    start = np.zeros(len(r), dtype=int)
+    start[1:] = np.where(plus == minus, np.arange(1, len(r)), 0)
+    start = np.maximum.accumulate(start)
+    return r * (sign * sign[start])
+
+
+def _unwrap(phase: ndarray) -> ndarray:
+    """
+    Unwrap a phase like `np.unwrap`, counting the corrections in integer
+    numbers of periods so that no rounding error accumulates along the sweep.
+    """
+    periods = np.cumsum(np.round(np.diff(phase) / (2 * np.pi)))
+    out = np.array(phase, dtype=float)
+    out[1:] -= 2 * np.pi * periods
+    return out
+
+
+def _tl_s(zline: float, z0: float, sh: ndarray, ch: ndarray, out: ndarray = None) -> ndarray:
+    """
+    S-parameters of a transmission line, see IEEEP370.makeTL.
+
+    `sh` and `ch` are sinh(gamma * l) and cosh(gamma * l), which stay
+    constant while peeling. The result is written into `out` if given.
+    """
+    if out is None:
+        out = np.empty(sh.shape + (2, 2), dtype=complex)
+    den = (zline**2 + z0**2) * sh + 2 * z0 * zline * ch
+    np.divide((zline**2 - z0**2) * sh, den, out=out[:, 0, 0])
+    np.divide(2 * z0 * zline, den, out=out[:, 1, 0])
+    out[:, 0, 1] = out[:, 1, 0]
+    out[:, 1, 1] = out[:, 0, 0]
+    return out
+
+
+def _getz_first(s: ndarray, f: ndarray, z0: float) -> float:
+    """
+    First sample of IEEEP370.getz, as used by the peel loops.
+
+    Only one sample of the step response is needed, so it is summed
+    directly from the impulse response without the full cumulative sum.
+    """
+    n = len(s)
+    spectrum = np.empty(n + 1, dtype=complex)
+    spectrum[0] = IEEEP370.DC(s, f, 1e-10)
+    spectrum[1:] = s
+    t = irfft(spectrum)
+    step = t[0] + t[n:].sum()
+    return -z0 * (step + 1) / (step - 1)
+
+
+@lru_cache(maxsize=32)
+def _dc_interp_weights(fp: tuple) -> ndarray:
+    """
+    Weights of the DC value of the symmetric cubic spline in dc_interp.
+
+    The spline value at DC is linear in the samples. Its real part only
+    depends on the real part of the positive frequency samples `fp`.
+    """
+    n = len(fp)
+    fnp = concatenate((-1*flip(fp), fp))
+    w = CubicSpline(fnp, np.eye(2 * n), axis=0)(0)
+    # the negative frequency samples are the mirrored conjugates
+    return w[n:] + flip(w[:n])
+
+
+@lru_cache(maxsize=4)
+def _dc_step_setup(f_bytes: bytes) -> tuple[ndarray, int]:
+    """
+    Receiver filter and -3 ns step sample index used by IEEEP370.DC.
+
+    Both only depend on the frequency vector, passed as `f.tobytes()`.
+    """
+    f = np.frombuffer(f_bytes)
+    df = f[1] - f[0]
+    n = len(f)
+    t = np.linspace(-1/df,1/df,n*2+1)
+    ts = np.argmin(np.abs(t - (-3e-9)))
+    Hr = IEEEP370.COM_receiver_noise_filter(f, f[-1]/2)
+    return Hr, ts
+
+
+def _y2a(y: ndarray) -> ndarray:
+    """
+    Convert admittance parameters to abcd parameters.
+    """
+    y11, y12, y21, y22 = y[:, 0, 0], y[:, 0, 1], y[:, 1, 0], y[:, 1, 1]
+    a = np.empty_like(y)
+    a[:, 0, 0] = -y22 / y21
+    a[:, 0, 1] = -1. / y21
+    a[:, 1, 0] = -(y11 * y22 - y12 * y21) / y21
+    a[:, 1, 1] = -y11 / y21
+    return a
+
 class Deembedding(ABC):
     """
     Abstract Base Class for all de-embedding objects.
@@ -112,13 +331,12 @@ class Deembedding(ABC):
             by sub-classes if needed.
         """
 
-       # ensure all the dummy Networks' frequency's are the same
-        for dmyntwk in dummies:
-            if dummies[0].frequency != dmyntwk.frequency:
-                warnings.warn('Dummy Networks dont have matching frequencies, attempting overlap.', RuntimeWarning,
-                              stacklevel=2)
-                dummies = overlap_multi(dummies)
-                break
+        # ensure all the dummy Networks' frequency's are the same
+        frequency = dummies[0].frequency
+        if any(dmyntwk.frequency != frequency for dmyntwk in dummies[1:]):
+            warnings.warn('Dummy Networks dont have matching frequencies, attempting overlap.', RuntimeWarning,
+                          stacklevel=2)
+            dummies = overlap_multi(dummies)
 
         self.frequency = dummies[0].frequency
         self.dummies = dummies
@@ -147,6 +365,46 @@ class Deembedding(ABC):
         """
         pass
 
+    def deembed_many(self, ntwks):
+        """
+        Apply de-embedding correction to several Networks
+
+        Parameters
+        ----------
+        ntwks : list of :class:`~skrf.network.Network` objects
+            Network data of device measurements from which
+            parasitics needs to be removed via de-embedding
+
+        Returns
+        -------
+        caled : list of :class:`~skrf.network.Network` objects
+            Network data of the devices after de-embedding
+        """
+        return [self.deembed(ntwk) for ntwk in ntwks]
+
+    def _deembed_stacked(self, ntwks, *parameters):
+        """
+        De-embed several Networks with a single call to `_deembed_s`.
+
+        The s-parameters of the networks matching the dummy frequencies are
+        concatenated along the frequency axis and the dummy `parameters` are
+        tiled accordingly. The other networks go through :func:`deembed`.
+        """
+        ntwks = list(ntwks)
+        caled = [None] * len(ntwks)
+        stacked = [i for i, ntwk in enumerate(ntwks) if ntwk.frequency == self.frequency]
+        # the conversions depend on the s-parameter definition
+        for s_def in {ntwks[i].s_def for i in stacked}:
+            idx = [i for i in stacked if ntwks[i].s_def == s_def]
+            z0 = np.concatenate([ntwks[i].z0 for i in idx])
+            s = self._deembed_s(np.concatenate([ntwks[i].s for i in idx]), z0, s_def,
+                                *[np.tile(p, (len(idx), 1, 1)) for p in parameters])
+            for i, s_i in zip(idx, np.split(s, len(idx))):
+                caled[i] = ntwks[i].copy(shallow_copy=True)
+                caled[i].s = s_i
+
+        return [self.deembed(ntwk) if c is None else c for ntwk, c in zip(ntwks, caled)]
+
 
 class OpenShort(Deembedding):
     """
@@ -194,7 +452,7 @@ class OpenShort(Deembedding):
 
     """
 
-    def __init__(self, dummy_open, dummy_short, name=None, *args, **kwargs):
+    def __init__(self, dummy_open, dummy_short, name=None, *args, copy_dummies=True, **kwargs):
         """
         Open-Short De-embedding Initializer
 
@@ -210,6 +468,11 @@ class OpenShort(Deembedding):
         name : string
             Optional name of de-embedding object
 
+        copy_dummies : bool, optional
+            Store copies of the dummy networks, so that later changes to
+            the given networks do not affect this object. Set to False to
+            keep references to them instead. Default is True.
+
         args, kwargs:
             Passed to :func:`Deembedding.__init__`
 
@@ -218,12 +481,26 @@ class OpenShort(Deembedding):
         :func:`Deembedding.__init__`
 
         """
-        self.open = dummy_open.copy()
-        self.short = dummy_short.copy()
+        self.open = dummy_open.copy() if copy_dummies else dummy_open
+        self.short = dummy_short.copy() if copy_dummies else dummy_short
         dummies = [self.open, self.short]
 
         Deembedding.__init__(self, dummies, name, *args, **kwargs)
 
+        # the dummy parameters do not depend on the dut, compute them once
+        self._open_y, self._short_z = self._dummy_parameters(*self.dummies)
+
+    @staticmethod
+    def _dummy_parameters(op, sh):
+        """
+        Open Y-parameters and open de-embedded short Z-parameters.
+        """
+        open_y = op.y
+        # remove parallel parasitics from the short dummy
+        short_z = _batch_inv2x2(sh.y - open_y)
+
+        return open_y, short_z
+
     def deembed(self, ntwk):
         """
         Perform the de-embedding calculation
@@ -243,23 +520,36 @@ class OpenShort(Deembedding):
         """
 
         # check if the frequencies match with dummy frequencies
-        if ntwk.frequency != self.open.frequency:
+        if ntwk.frequency != self.frequency:
             warnings.warn('Network frequencies dont match dummy frequencies, attempting overlap.', RuntimeWarning,
                           stacklevel=2)
-            caled, op, sh = overlap_multi([ntwk, self.open, self.short])
+            ntwk, op, sh = overlap_multi([ntwk, *self.dummies])
+            open_y, short_z = self._dummy_parameters(op, sh)
         else:
-            caled, op, sh = ntwk.copy(), self.open, self.short
+            open_y, short_z = self._open_y, self._short_z
 
-        # remove parallel parasitics from the short dummy
-        deembeded_short = sh.copy()
-        deembeded_short.y = sh.y - op.y
-        # remove parallel parasitics from the dut
-        caled.y = caled.y - op.y
-        # remove series parasitics from the dut
-        caled.z = caled.z - deembeded_short.z
+        caled = ntwk.copy(shallow_copy=True)
+        caled.s = self._deembed_s(ntwk.s, ntwk.z0, ntwk.s_def, open_y, short_z)
 
         return caled
 
+    def deembed_many(self, ntwks):
+        return self._deembed_stacked(ntwks, self._open_y, self._short_z)
+
+    @staticmethod
+    def _deembed_s(s, z0, s_def, open_y, short_z):
+        """
+        S-parameters of the dut with the open and short parasitics removed.
+        """
+        # remove parallel parasitics from the dut
+        y = s2y(s, z0, s_def)
+        y -= open_y
+        # remove series parasitics from the dut
+        # y is ill-conditioned for series duts, convert through s
+        z = s2z(_y2s(y, z0, s_def), z0, s_def)
+        z -= short_z
+        return _z2s(z, z0, s_def)
+
 
 class Open(Deembedding):
     """
@@ -293,7 +583,7 @@ class Open(Deembedding):
     >>> realdut = dm.deembed(dut)
     """
 
-    def __init__(self, dummy_open, name=None, *args, **kwargs):
+    def __init__(self, dummy_open, name=None, *args, copy_dummies=True, **kwargs):
         """
         Open De-embedding Initializer
 
@@ -306,6 +596,11 @@ class Open(Deembedding):
         name : string
             Optional name of de-embedding object
 
+        copy_dummies : bool, optional
+            Store copies of the dummy networks, so that later changes to
+            the given networks do not affect this object. Set to False to
+            keep references to them instead. Default is True.
+
         args, kwargs:
             Passed to :func:`Deembedding.__init__`
 
@@ -314,11 +609,14 @@ class Open(Deembedding):
         :func:`Deembedding.__init__`
 
         """
-        self.open = dummy_open.copy()
+        self.open = dummy_open.copy() if copy_dummies else dummy_open
         dummies = [self.open]
 
         Deembedding.__init__(self, dummies, name, *args, **kwargs)
 
+        # the dummy parameters do not depend on the dut, compute them once
+        self._open_y = self.open.y
+
     def deembed(self, ntwk):
         """
         Perform the de-embedding calculation
@@ -337,19 +635,31 @@ class Open(Deembedding):
         """
 
         # check if the frequencies match with dummy frequencies
-        if ntwk.frequency != self.open.frequency:
+        if ntwk.frequency != self.frequency:
             warnings.warn('Network frequencies dont match dummy frequencies, attempting overlap.', RuntimeWarning,
                            stacklevel=2)
             ntwk, op = overlap_multi([ntwk, self.open])
+            open_y = op.y
         else:
-            op = self.open
+            open_y = self._open_y
 
-        caled = ntwk.copy()
-        # remove open parasitics
-        caled.y = ntwk.y - op.y
+        caled = ntwk.copy(shallow_copy=True)
+        caled.s = self._deembed_s(ntwk.s, ntwk.z0, ntwk.s_def, open_y)
 
         return caled
 
+    def deembed_many(self, ntwks):
+        return self._deembed_stacked(ntwks, self._open_y)
+
+    @staticmethod
+    def _deembed_s(s, z0, s_def, open_y):
+        """
+        S-parameters of the dut with the open parasitics removed.
+        """
+        y = s2y(s, z0, s_def)
+        y -= open_y
+        return _y2s(y, z0, s_def)
+
 
 class ShortOpen(Deembedding):
     """
@@ -388,7 +698,7 @@ class ShortOpen(Deembedding):
 
     """
 
-    def __init__(self, dummy_short, dummy_open, name=None, *args, **kwargs):
+    def __init__(self, dummy_short, dummy_open, name=None, *args, copy_dummies=True, **kwargs):
         """
         Short-Open De-embedding Initializer
 
@@ -404,6 +714,11 @@ class ShortOpen(Deembedding):
         name : string
             Optional name of de-embedding object
 
+        copy_dummies : bool, optional
+            Store copies of the dummy networks, so that later changes to
+            the given networks do not affect this object. Set to False to
+            keep references to them instead. Default is True.
+
         args, kwargs:
             Passed to :func:`Deembedding.__init__`
 
@@ -412,12 +727,26 @@ class ShortOpen(Deembedding):
         :func:`Deembedding.__init__`
 
         """
-        self.open = dummy_open.copy()
-        self.short = dummy_short.copy()
+        self.open = dummy_open.copy() if copy_dummies else dummy_open
+        self.short = dummy_short.copy() if copy_dummies else dummy_short
         dummies = [self.open, self.short]
 
         Deembedding.__init__(self, dummies, name, *args, **kwargs)
 
+        # the dummy parameters do not depend on the dut, compute them once
+        self._open_y, self._short_z = self._dummy_parameters(*self.dummies)
+
+    @staticmethod
+    def _dummy_parameters(op, sh):
+        """
+        Short de-embedded open Y-parameters and short Z-parameters.
+        """
+        short_z = sh.z
+        # remove series parasitics from the open dummy
+        open_y = _batch_inv2x2(op.z - short_z)
+
+        return open_y, short_z
+
     def deembed(self, ntwk):
         """
         Perform the de-embedding calculation
@@ -436,24 +765,36 @@ class ShortOpen(Deembedding):
         """
 
         # check if the frequencies match with dummy frequencies
-        if ntwk.frequency != self.open.frequency:
+        if ntwk.frequency != self.frequency:
             warnings.warn('Network frequencies dont match dummy frequencies, attempting overlap.', RuntimeWarning,
                           stacklevel=2)
-            ntwk, op, sh = overlap_multi([ntwk, self.open, self.short])
+            ntwk, op, sh = overlap_multi([ntwk, *self.dummies])
+            open_y, short_z = self._dummy_parameters(op, sh)
         else:
-            op, sh = self.open, self.short
+            open_y, short_z = self._open_y, self._short_z
 
-        caled = ntwk.copy()
-        # remove series parasitics from the open dummy
-        deembeded_open = op.copy()
-        deembeded_open.z = op.z - sh.z
-        # remove parallel parasitics from the dut
-        caled.z = ntwk.z - sh.z
-        # remove series parasitics from the dut
-        caled.y = caled.y - deembeded_open.y
+        caled = ntwk.copy(shallow_copy=True)
+        caled.s = self._deembed_s(ntwk.s, ntwk.z0, ntwk.s_def, open_y, short_z)
 
         return caled
 
+    def deembed_many(self, ntwks):
+        return self._deembed_stacked(ntwks, self._open_y, self._short_z)
+
+    @staticmethod
+    def _deembed_s(s, z0, s_def, open_y, short_z):
+        """
+        S-parameters of the dut with the short and open parasitics removed.
+        """
+        # remove series parasitics from the dut
+        z = s2z(s, z0, s_def)
+        z -= short_z
+        # remove parallel parasitics from the dut
+        # z is ill-conditioned for shunt duts, convert through s
+        y = s2y(_z2s(z, z0, s_def), z0, s_def)
+        y -= open_y
+        return _y2s(y, z0, s_def)
+
 
 class Short(Deembedding):
     """
@@ -489,7 +830,7 @@ class Short(Deembedding):
 
     """
 
-    def __init__(self, dummy_short, name=None, *args, **kwargs):
+    def __init__(self, dummy_short, name=None, *args, copy_dummies=True, **kwargs):
         """
         Short De-embedding Initializer
 
@@ -502,6 +843,11 @@ class Short(Deembedding):
         name : string
             Optional name of de-embedding object
 
+        copy_dummies : bool, optional
+            Store copies of the dummy networks, so that later changes to
+            the given networks do not affect this object. Set to False to
+            keep references to them instead. Default is True.
+
         args, kwargs:
             Passed to :func:`Deembedding.__init__`
 
@@ -510,11 +856,14 @@ class Short(Deembedding):
         :func:`Deembedding.__init__`
 
         """
-        self.short = dummy_short.copy()
+        self.short = dummy_short.copy() if copy_dummies else dummy_short
         dummies = [self.short]
 
         Deembedding.__init__(self, dummies, name, *args, **kwargs)
 
+        # the dummy parameters do not depend on the dut, compute them once
+        self._short_z = self.short.z
+
     def deembed(self, ntwk):
         """
         Perform the de-embedding calculation
@@ -533,19 +882,31 @@ class Short(Deembedding):
         """
 
         # check if the frequencies match with dummy frequencies
-        if ntwk.frequency != self.short.frequency:
+        if ntwk.frequency != self.frequency:
             warnings.warn('Network frequencies dont match dummy frequencies, attempting overlap.', RuntimeWarning,
                            stacklevel=2)
             ntwk, sh = overlap_multi([ntwk, self.short])
+            short_z = sh.z
         else:
-            sh = self.short
+            short_z = self._short_z
 
-        caled = ntwk.copy()
-        # remove short parasitics
-        caled.z = ntwk.z - sh.z
+        caled = ntwk.copy(shallow_copy=True)
+        caled.s = self._deembed_s(ntwk.s, ntwk.z0, ntwk.s_def, short_z)
 
         return caled
 
+    def deembed_many(self, ntwks):
+        return self._deembed_stacked(ntwks, self._short_z)
+
+    @staticmethod
+    def _deembed_s(s, z0, s_def, short_z):
+        """
+        S-parameters of the dut with the short parasitics removed.
+        """
+        z = s2z(s, z0, s_def)
+        z -= short_z
+        return _z2s(z, z0, s_def)
+
 
 class SplitPi(Deembedding):
     """
@@ -587,7 +948,7 @@ class SplitPi(Deembedding):
     >>> realdut = dm.deembed(dut)
     """
 
-    def __init__(self, dummy_thru, name=None, *args, **kwargs):
+    def __init__(self, dummy_thru, name=None, *args, copy_dummies=True, **kwargs):
         """
         SplitPi De-embedding Initializer
 
@@ -599,6 +960,11 @@ class SplitPi(Deembedding):
         name : string
             Optional name of de-embedding object
 
+        copy_dummies : bool, optional
+            Store copies of the dummy networks, so that later changes to
+            the given networks do not affect this object. Set to False to
+            keep references to them instead. Default is True.
+
         args, kwargs:
             Passed to :func:`Deembedding.__init__`
 
@@ -606,11 +972,32 @@ class SplitPi(Deembedding):
         ---------
         :func:`Deembedding.__init__`
         """
-        self.thru = dummy_thru.copy()
+        self.thru = dummy_thru.copy() if copy_dummies else dummy_thru
         dummies = [self.thru]
 
         Deembedding.__init__(self, dummies, name, *args, **kwargs)
 
+        # the dummy parameters do not depend on the dut, compute them once
+        self._left_inv_a, self._right_inv_a = self._dummy_parameters(self.thru)
+
+    @staticmethod
+    def _dummy_parameters(thru):
+        """
+        Inverse abcd parameters of the left and right halves of the pi-type thru dummy.
+        """
+        thru_y = thru.y
+        y11, y12, y21, y22 = thru_y[:,0,0], thru_y[:,0,1], thru_y[:,1,0], thru_y[:,1,1]
+        y_series = y21 + y12
+        left_y = np.empty_like(thru_y)
+        left_y[:,0,0] = (y11 + y22 - y_series) / 2
+        left_y[:,0,1] = y_series
+        left_y[:,1,0] = y_series
+        left_y[:,1,1] = -y_series
+        # the right half is the flipped left half
+        right_y = left_y[:, ::-1, ::-1]
+
+        return _batch_inv2x2(_y2a(left_y)), _batch_inv2x2(_y2a(right_y))
+
     def deembed(self, ntwk):
         """
         Perform the de-embedding calculation
@@ -628,25 +1015,31 @@ class SplitPi(Deembedding):
         """
 
         # check if the frequencies match with dummy frequencies
-        if ntwk.frequency != self.thru.frequency:
+        if ntwk.frequency != self.frequency:
             warnings.warn('Network frequencies dont match dummy frequencies, attempting overlap.',
                           RuntimeWarning, stacklevel=2)
             ntwk, thru = overlap_multi([ntwk, self.thru])
+            left_inv_a, right_inv_a = self._dummy_parameters(thru)
         else:
-            thru = self.thru
-
-        left = thru.copy()
-        left_y = left.y
-        left_y[:,0,0] = (thru.y[:,0,0] - thru.y[:,1,0] + thru.y[:,1,1] - thru.y[:,0,1]) / 2
-        left_y[:,0,1] = thru.y[:,1,0] + thru.y[:,0,1]
-        left_y[:,1,0] = thru.y[:,1,0] + thru.y[:,0,1]
-        left_y[:,1,1] = - thru.y[:,1,0] - thru.y[:,0,1]
-        left.y = left_y
-        right = left.flipped()
-        caled = left.inv ** ntwk ** right.inv
+            left_inv_a, right_inv_a = self._left_inv_a, self._right_inv_a
+
+        caled = ntwk.copy(shallow_copy=True)
+        caled.s = self._deembed_s(ntwk.s, ntwk.z0, ntwk.s_def, left_inv_a, right_inv_a)
 
         return caled
 
+    def deembed_many(self, ntwks):
+        return self._deembed_stacked(ntwks, self._left_inv_a, self._right_inv_a)
+
+    @staticmethod
+    def _deembed_s(s, z0, s_def, left_inv_a, right_inv_a):
+        """
+        S-parameters of the dut cascaded with the inverses of both halves.
+        """
+        a = s2a(s2s(s, z0, 'power', s_def), z0)
+        caled_a = _batch_matmul2x2(_batch_matmul2x2(left_inv_a, a), right_inv_a)
+        return s2s(a2s(caled_a, z0), z0, s_def, 'power')
+
 
 class SplitTee(Deembedding):
     """
@@ -688,7 +1081,7 @@ class SplitTee(Deembedding):
     >>> realdut = dm.deembed(dut)
     """
 
-    def __init__(self, dummy_thru, name=None, *args, **kwargs):
+    def __init__(self, dummy_thru, name=None, *args, copy_dummies=True, **kwargs):
         """
         SplitTee De-embedding Initializer
 
@@ -700,6 +1093,11 @@ class SplitTee(Deembedding):
         name : string
             Optional name of de-embedding object
 
+        copy_dummies : bool, optional
+            Store copies of the dummy networks, so that later changes to
+            the given networks do not affect this object. Set to False to
+            keep references to them instead. Default is True.
+
         args, kwargs:
             Passed to :func:`Deembedding.__init__`
 
@@ -707,11 +1105,30 @@ class SplitTee(Deembedding):
         ---------
         :func:`Deembedding.__init__`
         """
-        self.thru = dummy_thru.copy()
+        self.thru = dummy_thru.copy() if copy_dummies else dummy_thru
         dummies = [self.thru]
 
         Deembedding.__init__(self, dummies, name, *args, **kwargs)
 
+        # the dummy parameters do not depend on the dut, compute them once
+        self._left_inv_a, self._right_inv_a = self._dummy_parameters(self.thru)
+
+    @staticmethod
+    def _dummy_parameters(thru):
+        """
+        Inverse abcd parameters of the left and right halves of the tee-type thru dummy.
+        """
+        thru_z = thru.z
+        z11, z12, z21, z22 = thru_z[:,0,0], thru_z[:,0,1], thru_z[:,1,0], thru_z[:,1,1]
+        z_shunt = z21 + z12
+        left_z = np.empty_like(thru_z)
+        left_z[:] = z_shunt[:, None, None]
+        left_z[:,0,0] = (z11 + z22 + z_shunt) / 2
+        # the right half is the flipped left half
+        right_z = left_z[:, ::-1, ::-1]
+
+        return _batch_inv2x2(z2a(left_z)), _batch_inv2x2(z2a(right_z))
+
     def deembed(self, ntwk):
         """
         Perform the de-embedding calculation
@@ -729,25 +1146,31 @@ class SplitTee(Deembedding):
         """
 
         # check if the frequencies match with dummy frequencies
-        if ntwk.frequency != self.thru.frequency:
+        if ntwk.frequency != self.frequency:
             warnings.warn('Network frequencies dont match dummy frequencies, attempting overlap.',
                           RuntimeWarning, stacklevel=2)
             ntwk, thru = overlap_multi([ntwk, self.thru])
+            left_inv_a, right_inv_a = self._dummy_parameters(thru)
         else:
-            thru = self.thru
-
-        left = thru.copy()
-        left_z = left.z
-        left_z[:,0,0] = (thru.z[:,0,0] + thru.z[:,1,0] + thru.z[:,1,1] + thru.z[:,0,1]) / 2
-        left_z[:,0,1] = thru.z[:,1,0] + thru.z[:,0,1]
-        left_z[:,1,0] = thru.z[:,1,0] + thru.z[:,0,1]
-        left_z[:,1,1] = thru.z[:,1,0] + thru.z[:,0,1]
-        left.z = left_z
-        right = left.flipped()
-        caled = left.inv ** ntwk ** right.inv
+            left_inv_a, right_inv_a = self._left_inv_a, self._right_inv_a
+
+        caled = ntwk.copy(shallow_copy=True)
+        caled.s = self._deembed_s(ntwk.s, ntwk.z0, ntwk.s_def, left_inv_a, right_inv_a)
 
         return caled
 
+    def deembed_many(self, ntwks):
+        return self._deembed_stacked(ntwks, self._left_inv_a, self._right_inv_a)
+
+    @staticmethod
+    def _deembed_s(s, z0, s_def, left_inv_a, right_inv_a):
+        """
+        S-parameters of the dut cascaded with the inverses of both halves.
+        """
+        a = s2a(s2s(s, z0, 'power', s_def), z0)
+        caled_a = _batch_matmul2x2(_batch_matmul2x2(left_inv_a, a), right_inv_a)
+        return s2s(a2s(caled_a, z0), z0, s_def, 'power')
+
 
 class AdmittanceCancel(Deembedding):
     """
@@ -788,7 +1211,7 @@ class AdmittanceCancel(Deembedding):
     >>> realdut = dm.deembed(dut)
     """
 
-    def __init__(self, dummy_thru, name=None, *args, **kwargs):
+    def __init__(self, dummy_thru, name=None, *args, copy_dummies=True, **kwargs):
         """
         AdmittanceCancel De-embedding Initializer
 
@@ -801,6 +1224,11 @@ class AdmittanceCancel(Deembedding):
         name : string
             Optional name of de-embedding object
 
+        copy_dummies : bool, optional
+            Store copies of the dummy networks, so that later changes to
+            the given networks do not affect this object. Set to False to
+            keep references to them instead. Default is True.
+
         args, kwargs:
             Passed to :func:`Deembedding.__init__`
 
@@ -809,11 +1237,14 @@ class AdmittanceCancel(Deembedding):
         :func:`Deembedding.__init__`
 
         """
-        self.thru = dummy_thru.copy()
+        self.thru = dummy_thru.copy() if copy_dummies else dummy_thru
         dummies = [self.thru]
 
         Deembedding.__init__(self, dummies, name, *args, **kwargs)
 
+        # the dummy parameters do not depend on the dut, compute them once
+        self._thru_inv_a = _batch_inv2x2(s2a(self.thru.s_power, self.thru.z0))
+
     def deembed(self, ntwk):
         """
         Perform the de-embedding calculation
@@ -833,20 +1264,36 @@ class AdmittanceCancel(Deembedding):
         """
 
         # check if the frequencies match with dummy frequencies
-        if ntwk.frequency != self.thru.frequency:
+        if ntwk.frequency != self.frequency:
             warnings.warn('Network frequencies dont match dummy frequencies, attempting overlap.',
                           RuntimeWarning, stacklevel=2)
             ntwk, thru = overlap_multi([ntwk, self.thru])
+            thru_inv_a = _batch_inv2x2(s2a(thru.s_power, thru.z0))
         else:
-            thru = self.thru
+            thru_inv_a = self._thru_inv_a
 
-        caled = ntwk.copy()
-        h = ntwk ** thru.inv
-        h_ = h.flipped()
-        caled.y = (h.y + h_.y) / 2
+        caled = ntwk.copy(shallow_copy=True)
+        caled.s = self._deembed_s(ntwk.s, ntwk.z0, ntwk.s_def, thru_inv_a)
 
         return caled
 
+    def deembed_many(self, ntwks):
+        return self._deembed_stacked(ntwks, self._thru_inv_a)
+
+    @staticmethod
+    def _deembed_s(s, z0, s_def, thru_inv_a):
+        """
+        S-parameters of the dut with the thru admittance cancelled.
+        """
+        # cascade the dut with the inverse of the thru
+        h_a = _batch_matmul2x2(s2a(s2s(s, z0, 'power', s_def), z0), thru_inv_a)
+        # abcd to y is ill-conditioned for shunt networks, convert through s
+        h_y = s2y(a2s(h_a, z0), z0, 'power')
+        # average with the flipped network
+        h_y += h_y[:, ::-1, ::-1]
+        h_y /= 2
+        return _y2s(h_y, z0, s_def)
+
 
 class ImpedanceCancel(Deembedding):
     """
@@ -890,7 +1337,7 @@ class ImpedanceCancel(Deembedding):
     >>> realdut = dm.deembed(dut)
     """
 
-    def __init__(self, dummy_thru, name=None, *args, **kwargs):
+    def __init__(self, dummy_thru, name=None, *args, copy_dummies=True, **kwargs):
         """
         ImpedanceCancel De-embedding Initializer
 
@@ -903,6 +1350,11 @@ class ImpedanceCancel(Deembedding):
         name : string
             Optional name of de-embedding object
 
+        copy_dummies : bool, optional
+            Store copies of the dummy networks, so that later changes to
+            the given networks do not affect this object. Set to False to
+            keep references to them instead. Default is True.
+
         args, kwargs:
             Passed to :func:`Deembedding.__init__`
 
@@ -911,11 +1363,14 @@ class ImpedanceCancel(Deembedding):
 
         :func:`Deembedding.__init__`
         """
-        self.thru = dummy_thru.copy()
+        self.thru = dummy_thru.copy() if copy_dummies else dummy_thru
         dummies = [self.thru]
 
         Deembedding.__init__(self, dummies, name, *args, **kwargs)
 
+        # the dummy parameters do not depend on the dut, compute them once
+        self._thru_inv_a = _batch_inv2x2(s2a(self.thru.s_power, self.thru.z0))
+
     def deembed(self, ntwk):
         """
         Perform the de-embedding calculation
@@ -935,20 +1390,36 @@ class ImpedanceCancel(Deembedding):
         """
 
         # check if the frequencies match with dummy frequencies
-        if ntwk.frequency != self.thru.frequency:
+        if ntwk.frequency != self.frequency:
             warnings.warn('Network frequencies dont match dummy frequencies, attempting overlap.',
                           RuntimeWarning, stacklevel=2)
             ntwk, thru = overlap_multi([ntwk, self.thru])
+            thru_inv_a = _batch_inv2x2(s2a(thru.s_power, thru.z0))
         else:
-            thru = self.thru
+            thru_inv_a = self._thru_inv_a
 
-        caled = ntwk.copy()
-        h = ntwk ** thru.inv
-        h_ = h.flipped()
-        caled.z = (h.z + h_.z) / 2
+        caled = ntwk.copy(shallow_copy=True)
+        caled.s = self._deembed_s(ntwk.s, ntwk.z0, ntwk.s_def, thru_inv_a)
 
         return caled
 
+    def deembed_many(self, ntwks):
+        return self._deembed_stacked(ntwks, self._thru_inv_a)
+
+    @staticmethod
+    def _deembed_s(s, z0, s_def, thru_inv_a):
+        """
+        S-parameters of the dut with the thru impedance cancelled.
+        """
+        # cascade the dut with the inverse of the thru
+        h_a = _batch_matmul2x2(s2a(s2s(s, z0, 'power', s_def), z0), thru_inv_a)
+        # abcd to z is ill-conditioned for series networks, convert through s
+        h_z = s2z(a2s(h_a, z0), z0, 'power')
+        # average with the flipped network
+        h_z += h_z[:, ::-1, ::-1]
+        h_z /= 2
+        return _z2s(h_z, z0, s_def)
+
 
 class IEEEP370(Deembedding):
     """
@@ -1072,19 +1543,21 @@ class IEEEP370(Deembedding):
         return ntwk_dc
 
     @staticmethod
-    def dc_interp(s: ndarray, f: ndarray) -> float:
+    def dc_interp(s: ndarray, f: ndarray) -> float | ndarray:
         """
         enforces symmetric upon the first 10 points and interpolates the DC
         point.
+
+        `s` can have trailing dimensions, e.g. all the S-parameters of a
+        network, which are then interpolated at once.
         """
         sp = s[0:9]
         fp = f[0:9]
 
-        snp = concatenate((conj(flip(sp)), sp))
-        fnp = concatenate((-1*flip(fp), fp))
         # mhuser : used cubic instead spline (not implemented)
-        snew = interp1d(fnp, snp, axis=0, kind = 'cubic')
-        return real(snew(0))
+        # the spline is evaluated at DC only, apply its weights directly
+        w = _dc_interp_weights(tuple(fp))
+        return np.tensordot(w, real(sp), axes=(0, 0))
 
     @staticmethod
     def COM_receiver_noise_filter(f: ndarray, fr: float) -> ndarray:
@@ -1093,8 +1566,12 @@ class IEEEP370(Deembedding):
         As defined in 802.3-2022 - IEEE Standard for Ethernet annex 93A
         """
         fdfr = f / fr
-        # eq 93A-20
-        return 1 / (1 - 3.414214 * fdfr**2 + fdfr**4 + 1j*2.613126*(fdfr - fdfr**3))
+        fdfr2 = fdfr * fdfr
+        # eq 93A-20, real and imaginary parts of the denominator in Horner form
+        den = np.empty(np.shape(fdfr), dtype=complex)
+        den.real = 1 + fdfr2 * (fdfr2 - 3.414214)
+        den.imag = 2.613126 * fdfr * (1 - fdfr2)
+        return 1 / den
 
     @staticmethod
     def makeStep(impulse: ndarray) -> ndarray:
@@ -1110,26 +1587,25 @@ class IEEEP370(Deembedding):
     def DC(s: ndarray, f: ndarray, allowedError: float = 1e-12) -> float:
         """
         Advanced reflective DC point extrapolation.
+
+        The DC point is chosen such that the step response is zero at -3 ns.
+        The step response is linear in the DC point, so it is solved for
+        directly. `allowedError` is kept for backward compatibility.
         """
-        DCpoint = 0.002 # seed for the algorithm
-        err = 1 # error seed
-        cnt = 0
-        df = f[1] - f[0]
         n = len(f)
-        t = np.linspace(-1/df,1/df,n*2+1)
-        ts = np.argmin(np.abs(t - (-3e-9)))
-        Hr = IEEEP370.COM_receiver_noise_filter(f, f[-1]/2)
-        while(err > allowedError):
-            h1 = IEEEP370.makeStep(
-                fftshift(irfft(concatenate(([DCpoint], Hr * s)), axis=0), axes=0))
-            h2 = IEEEP370.makeStep(
-                fftshift(irfft(concatenate(([DCpoint + 0.001], Hr * s)), axis=0), axes=0))
-            m = (h2[ts] - h1[ts]) / 0.001
-            b = h1[ts] - m * DCpoint
-            DCpoint = (0 - b) / m
-            err = np.abs(h1[ts] - 0)
-            cnt += 1
-        return DCpoint
+        Hr, ts = _dc_step_setup(np.asarray(f, dtype=float).tobytes())
+        # step response without DC point, summed directly on the unshifted
+        # impulse response: sample j of the fftshifted one is t[(j + n) % (2 * n)]
+        spectrum = zeros((n + 1,) + np.shape(s)[1:], dtype=complex)
+        np.multiply(Hr, s, out=spectrum[1:])
+        t = irfft(spectrum, axis=0)
+        if ts < n:
+            b = t[n:n + ts + 1].sum(axis=0)
+        else:
+            b = t[n:].sum(axis=0) + t[:ts - n + 1].sum(axis=0)
+        # a DC point adds 1 / (2 * n) to every impulse response sample
+        m = (ts + 1) / (2 * n)
+        return -b / m
 
     @staticmethod
     def thru(ntwk: Network) -> Network:
@@ -1178,10 +1654,7 @@ class IEEEP370(Deembedding):
         n = len(f)
         snew = zeros((n + 1, 2,2), dtype = complex)
         snew[1:,:,:] = s
-        snew[0, 0, 0] = IEEEP370.dc_interp(s[:, 0, 0], f)
-        snew[0, 0, 1] = IEEEP370.dc_interp(s[:, 0, 1], f)
-        snew[0, 1, 0] = IEEEP370.dc_interp(s[:, 1, 0], f)
-        snew[0, 1, 1] = IEEEP370.dc_interp(s[:, 1, 1], f)
+        snew[0] = IEEEP370.dc_interp(s, f)
 
         f = concatenate(([0], f))
         return Network(frequency = Frequency.from_f(f, 'Hz'), s = snew, z0 = z0)
@@ -1207,14 +1680,19 @@ class IEEEP370(Deembedding):
             Time-domain impedance step response
 
         """
-        DC11 = IEEEP370.DC(s, f, 1e-10)
-        t112x = irfft(concatenate(([DC11], s)))
-        #get the step response of t112x. Shift is needed for makeStep to
-        #work properly.
-        t112xStep = IEEEP370.makeStep(fftshift(t112x))
+        n = len(s)
+        spectrum = np.empty(n + 1, dtype=complex)
+        spectrum[0] = IEEEP370.DC(s, f, 1e-10)
+        spectrum[1:] = s
+        t112x = irfft(spectrum)
+        #get the step response of the fftshifted t112x, directly in the
+        #unshifted order: the step starts at sample n and wraps around
+        t112xStep = IEEEP370.makeStep(t112x)
+        total = t112xStep[-1]
+        t112xStep -= t112xStep[n - 1]
+        t112xStep[:n] += total
         #construct the transmission line
         z = -z0 * (t112xStep + 1) / (t112xStep - 1)
-        z = ifftshift(z) #impedance. Shift again to get the first point first.
         return z
 
     @staticmethod
@@ -1239,15 +1717,8 @@ class IEEEP370(Deembedding):
              S_Parameters of the transmission line
         """
         # todo: use DefinedGammaZ0 media instead
-        n = len(gamma)
-        TL = np.zeros((n, 2, 2), dtype = complex)
-        TL[:, 0, 0] = (((zline**2 - z0**2) * np.sinh(gamma * l))
-                       / ((zline**2 + z0**2) * np.sinh(gamma * l) + 2 * z0 * zline * np.cosh(gamma * l)))
-        TL[:, 1, 0] = (2 * z0 * zline) / ((zline**2 + z0**2) * np.sinh(gamma * l) + 2 * z0 * zline * np.cosh(gamma * l))
-        TL[:, 0, 1] = (2 * z0 * zline) / ((zline**2 + z0**2) * np.sinh(gamma * l) + 2 * z0 * zline * np.cosh(gamma * l))
-        TL[:, 1, 1] = (((zline**2 - z0**2) * np.sinh(gamma * l))
-                       / ((zline**2 + z0**2) * np.sinh(gamma * l) + 2 * z0 * zline * np.cosh(gamma * l)))
-        return TL
+        gl = np.asarray(gamma * l, dtype=complex)
+        return _tl_s(zline, z0, np.sinh(gl), np.cosh(gl))
 
     @staticmethod
     def NRP(ntwk: Network, TD: ndarray = None, port: int = None) -> (Network, ndarray):
@@ -1276,9 +1747,11 @@ class IEEEP370(Deembedding):
         """
         p = ntwk.s
         f = ntwk.frequency.f
-        n = len(f)
         X = ntwk.nports
         fend = f[-1]
+        # cascading a matched delay line on port i scales the i-th row and
+        # column of the s-matrix by the delay (and s_ii by the delay squared)
+        out = ntwk.copy()
         if TD is None:
             TD = np.zeros(X)
             for i in range(X):
@@ -1291,64 +1764,15 @@ class IEEEP370(Deembedding):
                     theta = -theta0
 
                 TD[i] = -theta / (2 * np.pi * fend)
-                pd = np.zeros((n, X, X), dtype = complex)
                 delay = exp(-1j * 2. * np.pi * f * TD[i] / 2.)
-                if i == 0:
-                    pd[:, i + X//2, i] = delay
-                    pd[:, i, i + X//2] = delay
-                    spd = ntwk.copy()
-                    spd.s = pd
-                    out = spd ** ntwk
-                elif i < X//2:
-                    pd[:, i + X//2, i] = delay
-                    pd[:, i, i + X//2] = delay
-                    spd = ntwk.copy()
-                    spd.s = pd
-                    out = spd ** out
-                else:
-                    pd[:, i - X//2, i] = delay
-                    pd[:, i, i - X//2] = delay
-                    spd = ntwk.copy()
-                    spd.s = pd
-                    out = out ** spd
+                out.s[:, i, :] *= delay[:, None]
+                out.s[:, :, i] *= delay[:, None]
         else:
-            pd = np.zeros((n, X, X), dtype = complex)
-            if port is not None:
-                i = port
+            ports = range(X) if port is None else [port]
+            for i in ports:
                 delay = exp(1j * 2. * np.pi * f * TD[i] / 2.)
-                if i < X//2:
-                    pd[:, i + X//2, i] = delay
-                    pd[:, i, i + X//2] = delay
-                    spd = ntwk.copy()
-                    spd.s = pd
-                    out = spd ** ntwk
-                else:
-                    pd[:, i - X//2, i] = delay
-                    pd[:, i, i - X//2] = delay
-                    spd = ntwk.copy()
-                    spd.s = pd
-                    out = ntwk ** spd
-            else:
-                for i in range(X):
-                    delay = exp(1j * 2. * np.pi * f * TD[i] / 2)
-                    if i == 0:
-                        pd[:, i + X//2, i] = delay
-                        pd[:, i, i + X//2] = delay
-                        spd = ntwk.copy()
-                        spd.s = pd
-                        out = spd ** ntwk
-                    elif i < X//2:
-                        pd[:, i + X//2, i] = delay
-                        pd[:, i, i + X//2] = delay
-                        spd = ntwk.copy()
-                        spd.s = pd
-                        out = spd ** out
-                    else:
-                        pd[:, i - X//2, i] = delay
-                        pd[:, i, i - X//2] = delay
-                        spd = ntwk.copy()
-                        spd.s = pd
-                        out = out ** spd
+                out.s[:, i, :] *= delay[:, None]
+                out.s[:, :, i] *= delay[:, None]
         return out, TD
 
     @staticmethod
@@ -1462,33 +1886,42 @@ class IEEEP370(Deembedding):
         """
         f = ntwk.frequency.f
         n = len(f)
-        out = ntwk.copy()
         Omega0 = np.pi/n
         Omega = np.arange(Omega0, np.pi + Omega0, Omega0)
         betal = 1j * Omega/2
+        sh, ch = np.sinh(betal), np.cosh(betal)
+        sTL = np.empty((n, 2, 2), dtype=complex)
+        #the cascades are done on T-parameters arrays rather than on Networks
+        t_out = _s2t(ntwk.s)
+        s11 = ntwk.s[:, 0, 0]
+        s22 = ntwk.s[:, 1, 1]
         for i in range(N):
-            p = out.s
             #calculate impedance
-            zline1 = IEEEP370.getz(p[:, 0, 0], f, z0)[0]
-            zline2 = IEEEP370.getz(p[:, 1, 1], f, z0)[0]
+            zline1 = _getz_first(s11, f, z0)
+            zline2 = _getz_first(s22, f, z0)
             #this is the transmission line to be removed
-            TL1 = IEEEP370.makeTL(zline1, z0, betal, 1)
-            TL2 = IEEEP370.makeTL(zline2, z0, betal, 1)
-            sTL1 = ntwk.copy()
-            sTL1.s = TL1
-            sTL2 = ntwk.copy()
-            sTL2.s = TL2
+            tTL1 = _s2t(_tl_s(zline1, z0, sh, ch, out=sTL))
+            tTL2 = _s2t(_tl_s(zline2, z0, sh, ch, out=sTL))
             #remove the errorboxes
             # no need to flip sTL2 because it is symmetrical
-            out = sTL1.inv ** out ** sTL2.inv
+            t_out = _batch_matmul2x2(_batch_matmul2x2(_batch_inv2x2(tTL1), t_out),
+                                     _batch_inv2x2(tTL2))
+            s11 = t_out[:, 0, 1] / t_out[:, 1, 1]
+            s22 = -t_out[:, 1, 0] / t_out[:, 1, 1]
             #capture the errorboxes from side 1 and 2
             if i == 0:
-                eb1 = sTL1.copy()
-                eb2 = sTL2.copy()
+                t_eb1 = tTL1
+                t_eb2 = tTL2
             else:
-                eb1 = eb1 ** sTL1
-                eb2 = sTL2 ** eb2
+                t_eb1 = _batch_matmul2x2(t_eb1, tTL1)
+                t_eb2 = _batch_matmul2x2(tTL2, t_eb2)
 
+        out = ntwk.copy()
+        out.s = _t2s(t_out)
+        eb1 = ntwk.copy()
+        eb1.s = _t2s(t_eb1)
+        eb2 = ntwk.copy()
+        eb2.s = _t2s(t_eb2)
         return out, eb1, eb2
 
 class IEEEP370_FER:
@@ -2124,10 +2557,10 @@ class IEEEP370_TD_QM:
         Todo: Consider using irfft instead.
         """
         N = len(s_ij)
-        s_ij_conj = zeros(2 * N - 1, dtype = complex)
+        s_ij_conj = np.empty(2 * N - 1, dtype = complex)
         s_ij_conj[:N] = s_ij
-        for k in range(N - 1):
-            s_ij_conj[k + N] = np.conj(s_ij_conj[N - k - 1])
+        # conjugate the reversed view straight into the output
+        np.conjugate(s_ij[:0:-1], out = s_ij_conj[N:])
 
         return s_ij_conj
 
@@ -3268,14 +3701,16 @@ class IEEEP370_SE_NZC_2xThru(IEEEP370):
             # irfft is equivalent to ifft(makeSymmetric(x))
             t11r = fftshift(irfft(concatenate(([dcs11r], s11r)), axis=0), axes=0)
             t11r[x:] = 0
-            e001 = fft(ifftshift(t11r))
-            e001 = e001[1:n+1]
+            # the gated response is real: use rfft and fold the ifftshift by
+            # n samples into a (-1)**k phase ramp
+            e001 = rfft(t11r)[1:]
+            e001[::2] *= -1
 
             dcs22r = IEEEP370.DC(s22r, f)
             t22r = fftshift(irfft(concatenate(([dcs22r], s22r)), axis=0), axes=0)
             t22r[x:] = 0
-            e002 = fft(ifftshift(t22r))
-            e002 = e002[1:n+1]
+            e002 = rfft(t22r)[1:]
+            e002[::2] *= -1
 
             # calc e111 and e112
             e111 = (s22r - e002) / s12r
@@ -3306,16 +3741,8 @@ class IEEEP370_SE_NZC_2xThru(IEEEP370):
 
             # calc e01 and e10
             # avoid 180° phase jumps in case of phase noise
-            e01 = np.sqrt(s21r * (1 - e111 * e112))
-            for i in range(n):
-                if i > 0:
-                    if np.abs(-e01[i] - e01[i-1]) < np.abs(e01[i] - e01[i-1]):
-                        e01[i] = - e01[i]
-            e10 = np.sqrt(s12r * (1 - e111 * e112))
-            for i in range(n):
-                if i > 0:
-                    if np.abs(-e10[i] - e10[i-1]) < np.abs(e10[i] - e10[i-1]):
-                        e10[i] = - e10[i]
+            e01 = _continuous_sign(np.sqrt(s21r * (1 - e111 * e112)))
+            e10 = _continuous_sign(np.sqrt(s12r * (1 - e111 * e112)))
 
 
             # revert to initial freq axis
@@ -4090,25 +4517,26 @@ class IEEEP370_SE_ZC_2xThru(IEEEP370):
             z1 = IEEEP370.getz(s11dut, f, z0)
             z2 = IEEEP370.getz(s22dut, f, z0)
         #peel the fixture away and create the fixture model
+        #the cascades are done on T-parameters arrays rather than on Networks
         #python range to n-1, thus 1 to be added to have proper iteration number
+        t_dut = _s2t(s_dut.s)
+        sh, ch = np.sinh(gamma * l), np.cosh(gamma * l)
+        sTL = np.empty((n, 2, 2), dtype=complex)
         for i in range(self.x_end + 1):
-            zline1 = IEEEP370.getz(s11dut, f, z0)[0]
-            zline2 = IEEEP370.getz(s22dut, f, z0)[0]
-            TL1 = self.makeTL(zline1,z0,gamma,l)
-            TL2 = self.makeTL(zline2,z0,gamma,l)
-            sTL1 = s_dut.copy()
-            sTL1.s = TL1
-            sTL2 = s_dut.copy()
-            sTL2.s = TL2
+            zline1 = _getz_first(s11dut, f, z0)
+            zline2 = _getz_first(s22dut, f, z0)
+            tTL1 = _s2t(_tl_s(zline1, z0, sh, ch, out=sTL))
+            tTL2 = _s2t(_tl_s(zline2, z0, sh, ch, out=sTL))
             if i == 0:
-                errorbox1 = sTL1
-                errorbox2 = sTL2
+                t_errorbox1 = tTL1
+                t_errorbox2 = tTL2
             else:
-                errorbox1 = errorbox1 ** sTL1
-                errorbox2 = errorbox2 ** sTL2
+                t_errorbox1 = _batch_matmul2x2(t_errorbox1, tTL1)
+                t_errorbox2 = _batch_matmul2x2(t_errorbox2, tTL2)
             # equivalent to function removeTL(in,TL1,TL2,z0)
             # no need to flip sTL2 because it is symmetrical
-            s_dut = sTL1.inv ** s_dut ** sTL2.inv
+            t_dut = _batch_matmul2x2(_batch_matmul2x2(_batch_inv2x2(tTL1), t_dut),
+                                     _batch_inv2x2(tTL2))
             #IEEE abcd implementation
             # abcd_TL1 = sTL1.a
             # abcd_TL2 = sTL2.a
@@ -4118,12 +4546,15 @@ class IEEEP370_SE_ZC_2xThru(IEEEP370):
             #                                        np.linalg.lstsq(abcd_TL1[j, :, :], abcd_in[j, :, :],
             #                                        rcond=None)[0].T, rcond=None)[0].T
             # s_dut.a = abcd_in
-            s11dut = s_dut.s[:, 0, 0]
-            s22dut = s_dut.s[:, 1, 1]
-            # store fixture z for debug
-            if(i == self.x_end):
-                self.z_side1 = IEEEP370.getz(errorbox1.s[:, 0, 0], f, z0)
-                self.z_side2 = IEEEP370.getz(errorbox2.s[:, 0, 0], f, z0)
+            s11dut = t_dut[:, 0, 1] / t_dut[:, 1, 1]
+            s22dut = -t_dut[:, 1, 0] / t_dut[:, 1, 1]
+        errorbox1 = s_dut.copy()
+        errorbox1.s = _t2s(t_errorbox1)
+        errorbox2 = s_dut.copy()
+        errorbox2.s = _t2s(t_errorbox2)
+        # store fixture z for debug
+        self.z_side1 = IEEEP370.getz(errorbox1.s[:, 0, 0], f, z0)
+        self.z_side2 = IEEEP370.getz(errorbox2.s[:, 0, 0], f, z0)
         if self.verbose:
             zdut1 = IEEEP370.getz(s11dut, f, z0)
             zdut2 = IEEEP370.getz(s22dut, f, z0)
@@ -4164,22 +4595,25 @@ class IEEEP370_SE_ZC_2xThru(IEEEP370):
         if self.verbose:
             z1 = IEEEP370.getz(s11dut, f, z0)
         #peel the fixture away and create the fixture model
+        #the cascades are done on T-parameters arrays rather than on Networks
         #python range to n-1, thus 1 to be added to have proper iteration number
+        t_dut = _s2t(s_dut.s)
+        sh, ch = np.sinh(gamma * l), np.cosh(gamma * l)
+        sTL = np.empty((n, 2, 2), dtype=complex)
         for i in range(self.x_end + 1):
-            zline1 = IEEEP370.getz(s11dut, f, z0)[0]
-            TL1 = self.makeTL(zline1,z0,gamma,l)
-            sTL1 = s_dut.copy()
-            sTL1.s = TL1
+            zline1 = _getz_first(s11dut, f, z0)
+            tTL1 = _s2t(_tl_s(zline1, z0, sh, ch, out=sTL))
             if i == 0:
-                errorbox1 = sTL1
+                t_errorbox1 = tTL1
             else:
-                errorbox1 = errorbox1 ** sTL1
+                t_errorbox1 = _batch_matmul2x2(t_errorbox1, tTL1)
             # equivalent to function removeTL_side1(in,TL,z0)
-            s_dut = sTL1.inv ** s_dut
-            s11dut = s_dut.s[:, 0, 0]
-            # store fixture z for debug
-            if(i == self.x_end):
-                self.z_side1 = IEEEP370.getz(errorbox1.s[:, 0, 0], f, z0)
+            t_dut = _batch_matmul2x2(_batch_inv2x2(tTL1), t_dut)
+            s11dut = t_dut[:, 0, 1] / t_dut[:, 1, 1]
+        errorbox1 = s_dut.copy()
+        errorbox1.s = _t2s(t_errorbox1)
+        # store fixture z for debug
+        self.z_side1 = IEEEP370.getz(errorbox1.s[:, 0, 0], f, z0)
         if self.verbose:
             zdut1 = IEEEP370.getz(s11dut, f, z0)
             fig, axs = subplots(1, 1, sharex = True, figsize=(6.4, 4.8))
@@ -4260,7 +4694,7 @@ class IEEEP370_SE_ZC_2xThru(IEEEP370):
         #grabbing s21
         s212x = s2xthru.s[:, 1, 0]
         #get the attenuation and phase constant per length
-        beta_per_length = -unwrap(angle(s212x))
+        beta_per_length = -_unwrap(angle(s212x))
         # because lossless would be abs(S11)**2 + abs(S21)**2 = 1
         attenuation = np.abs(s2xthru.s[:,1,0])**2 / (1. - np.abs(s2xthru.s[:,0,0])**2)
         alpha_per_length = (10.0 * np.log10(attenuation)) / -8.686 # not 20 * log10() because of **2 above
@@ -4270,9 +4704,16 @@ class IEEEP370_SE_ZC_2xThru(IEEEP370):
         else:
             #fit the attenuation up to the limited bandwidth
             bwl_x = np.argmin(np.abs(f - self.bandwidth_limit))
-            X = np.array([np.sqrt(f[0:bwl_x+1]), f[0:bwl_x+1], f[0:bwl_x+1]**2])
-            b = np.linalg.lstsq(X.conj().T, alpha_per_length[0:bwl_x+1], rcond=None)[0]
-            alpha_per_length_fit = b[0] * np.sqrt(f) + b[1] * f + b[2] * f**2
+            # solve the 3x3 normal equations, with the frequency normalized
+            # to the bandwidth limit to keep them well conditioned
+            # the design matrix columns are computed once for the whole band
+            fbw = f[bwl_x]
+            fn = f / fbw
+            X = np.array([np.sqrt(fn), fn, fn * fn])
+            Xbw = X[:, 0:bwl_x+1]
+            c = np.linalg.solve(Xbw @ Xbw.T, Xbw @ alpha_per_length[0:bwl_x+1])
+            alpha_per_length_fit = c @ X
+            b = c / [np.sqrt(fbw), fbw, fbw**2]
             #divide by 2*n + 1 to get prop constant per discrete unit length
             self.gamma = alpha_per_length_fit + 1j * beta_per_length # gamma without DC
         if self.verbose:
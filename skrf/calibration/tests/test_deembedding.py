@@ -319,6 +319,65 @@ class DeembeddingTestCase(unittest.TestCase):
         ind_calc = 1e9*np.imag(1/dut.y[0,0,0])/2/np.pi/dut.f
         self.assertTrue(np.isclose(ind_calc, 1, rtol=self.rtol))
 
+    def test_thru_complex_z0(self):
+        """
+        Results of the thru based methods do not depend on the
+        port impedances, including complex ones with power-waves.
+        """
+        for dm_class, raw, thru in [(rf.SplitPi, self.raw3_1f, self.thru3_1f),
+                                    (rf.SplitTee, self.raw4_1f, self.thru4_1f),
+                                    (rf.AdmittanceCancel, self.raw5_1f, self.thru5_1f),
+                                    (rf.ImpedanceCancel, self.raw6_1f, self.thru6_1f)]:
+            raw_c, thru_c = raw.copy(), thru.copy()
+            raw_c.renormalize(30 + 5j)
+            thru_c.renormalize(30 + 5j)
+            dut = dm_class(thru_c).deembed(raw_c)
+            ind_calc = 1e9*np.imag(1/dut.y[0,0,0])/2/np.pi/dut.f
+            self.assertTrue(np.isclose(ind_calc, 1, rtol=self.rtol))
+
+    def test_deembed_many(self):
+        """
+        Batched de-embedding gives the same results as de-embedding
+        the networks one at a time.
+        """
+        for dm, raw in [(rf.OpenShort(self.open, self.short), self.raw),
+                        (rf.Open(self.open7), self.raw7),
+                        (rf.ShortOpen(self.short2, self.open2), self.raw2),
+                        (rf.Short(self.short8), self.raw8),
+                        (rf.SplitPi(self.thru3), self.raw3),
+                        (rf.SplitTee(self.thru4), self.raw4),
+                        (rf.AdmittanceCancel(self.thru5), self.raw5),
+                        (rf.ImpedanceCancel(self.thru6), self.raw6)]:
+            raw_c = raw.copy()
+            raw_c.renormalize(30 + 5j)
+            raw_p = raw.copy()
+            raw_p.renormalize(40, s_def='pseudo')
+            raw_half = raw[0:len(raw)//2]
+            ntwks = [raw, raw_c, raw_p, raw_half]
+            with self.assertWarns(RuntimeWarning):
+                duts = dm.deembed_many(ntwks)
+            with self.assertWarns(RuntimeWarning):
+                dut_half = dm.deembed(raw_half)
+            expected = [dm.deembed(ntwk) for ntwk in ntwks[:-1]] + [dut_half]
+            self.assertEqual(len(duts), len(ntwks))
+            for dut, exp in zip(duts, expected):
+                self.assertEqual(dut.frequency, exp.frequency)
+                self.assertEqual(dut.s_def, exp.s_def)
+                np.testing.assert_allclose(dut.z0, exp.z0)
+                np.testing.assert_allclose(dut.s, exp.s, atol=1e-12)
+
+    def test_copy_dummies(self):
+        """
+        Dummies are copied by default and referenced with copy_dummies=False.
+        """
+        dm_copy = rf.OpenShort(self.open, self.short)
+        dm_ref = rf.OpenShort(self.open, self.short, copy_dummies=False)
+        self.assertIsNot(dm_copy.open, self.open)
+        self.assertIsNot(dm_copy.short, self.short)
+        self.assertIs(dm_ref.open, self.open)
+        self.assertIs(dm_ref.short, self.short)
+        np.testing.assert_array_equal(dm_copy.deembed(self.raw).s, dm_ref.deembed(self.raw).s)
+
     def test_IEEEP370_SE_NZC_2xThru(self):
         """
         Test test_IEEEP370_SE_NZC_2xThru.
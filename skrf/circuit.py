@@ -105,6 +105,8 @@ from .network import Network, connect, innerconnect, s2s
 from .util import subplots
 
 if TYPE_CHECKING:
+    from numpy.typing import DTypeLike
+
     from .frequency import Frequency
 
 
@@ -149,13 +151,15 @@ class Circuit:
         max_nports: NotRequired[int]
         dynamic_networks: NotRequired[Sequence[Network]]
 
-    CACHEDPROPERTIES = ('s', 'X', 'X_F', 'C', 'C_F', 'T')
+    CACHEDPROPERTIES = ('s', 'X', 'X_F', 'C', 'C_F', 'T', 'dim', 'port_indexes', 'port_z0',
+                        '_connections_z0')
 
     def __init__(self,
                  connections: list[list[tuple[Network, int]]],
                  name: str | None = None,
                  *,
-                 auto_reduce: bool = False, **kwargs: Unpack[_REDUCE_OPTIONS]) -> None:
+                 auto_reduce: bool = False, dtype: DTypeLike = complex,
+                 **kwargs: Unpack[_REDUCE_OPTIONS]) -> None:
         """
         Circuit constructor. Creates a circuit made of a set of N-ports networks.
 
@@ -176,6 +180,10 @@ class Circuit:
             Suitable for cases where only the S-parameters of the final circuit ports are of interest. Default is False.
             If `check_duplication`, `split_ground` or `max_nports` are provided as kwargs, `auto_reduce` will be
             automatically set to True, as this indicates an intent to use the `reduce_circuit` method.
+        dtype : complex data-type, optional
+            Data type of the circuit matrices [X], [C] and [S]. Default is `complex` (complex128).
+            `np.complex64` halves the memory and bandwidth of large circuits and long sweeps,
+            at the cost of about 7 significant digits instead of 15.
         **kwargs :
             keyword arguments passed to `reduce_circuit` method.
 
@@ -271,6 +279,9 @@ class Circuit:
         """
         self._connections = connections
         self.name = name
+        self.dtype = np.dtype(dtype)
+        if self.dtype.kind != 'c':
+            raise ValueError(f'dtype must be a complex data-type, got {self.dtype}.')
 
         # check if all networks have a name
         for cnx in self.connections:
@@ -329,8 +340,9 @@ class Circuit:
         """
         self._connections = connections
 
-        # Invalidate cached properties
-        for item in self.CACHEDPROPERTIES:
+        # Invalidate cached properties, including the networks dictionary built at init
+        # and the cascade description which may be None
+        for item in self.CACHEDPROPERTIES + ('_networks', '_cascade'):
             self.__dict__.pop(item, None)
 
     def update_networks(
@@ -442,7 +454,7 @@ class Circuit:
             self.connections = connections
             return None
 
-        return Circuit(connections=connections, name=name)
+        return Circuit(connections=connections, name=name, dtype=self.dtype)
 
     @classmethod
     def check_duplicate_names(cls, connections_list: list[tuple[int, tuple[Network, int]]]):
@@ -704,14 +716,21 @@ class Circuit:
         dict
             Dictionnary of Networks
         """
-        if not connections:
-            connections = self.connections
+        if not connections or connections is self.connections:
+            ntws = self._networks
+        else:
+            ntws = {ntw.name: ntw for cnx in connections for (ntw, _port) in cnx}
 
-        ntws: list[Network] = []
-        for cnx in connections:
-            for (ntw, _port) in cnx:
-                ntws.append(ntw)
-        return {ntw.name: ntw for ntw in ntws  if ntw.nports >= min_nports}
+        if min_nports <= 1:
+            return dict(ntws)
+        return {name: ntw for name, ntw in ntws.items() if ntw.nports >= min_nports}
+
+    @cached_property
+    def _networks(self) -> dict[str, Network]:
+        """
+        Return the dictionary of all the Networks of the circuit connections.
+        """
+        return {ntw.name: ntw for cnx in self.connections for (ntw, _port) in cnx}
 
     def networks_list(self,
                       connections: list[list[tuple[Network, int]]] | None = None,
@@ -731,11 +750,7 @@ class Circuit:
         list
             List of unique networks
         """
-        if not connections:
-            connections = self.connections
-
-        ntw_dict = self.networks_dict(connections)
-        return [ntw for ntw in ntw_dict.values() if ntw.nports >= min_nports]
+        return list(self.networks_dict(connections, min_nports).values())
 
     @property
     def connections_nb(self) -> int:
@@ -773,7 +788,7 @@ class Circuit:
         """
         return self.connections_nb + self.networks_nb
 
-    @property
+    @cached_property
     def dim(self) -> int:
         """
         Return the dimension of the C, X and global S matrices.
@@ -906,13 +921,30 @@ class Circuit:
         ----------
         .. [#] P. Hallbjörner, Microw. Opt. Technol. Lett. 38, 99 (2003).
         """
+        return self._Xk_y0((1 / self._cnx_z0(cnx_k)).astype(self.dtype, copy=False), order)
 
-        y0s = np.array([1/ntw.z0[:,ntw_port] for (ntw, ntw_port) in cnx_k]).T
-        y_k = y0s.sum(axis=1)
+    @staticmethod
+    def _Xk_y0(y0s: np.ndarray, order: MemoryLayoutT = 'C', y_k: np.ndarray | None = None) -> np.ndarray:
+        """
+        Return the scattering matrices [X]_k of an intersection from the
+        characteristic admittances of its ports, of shape `f x n`.
 
-        Xs = np.zeros((len(self.frequency), len(cnx_k), len(cnx_k)), dtype='complex', order=order)
+        Their sum `y_k` is computed if not given. See :func:`_Xk`.
+        """
+        if y_k is None:
+            y_k = y0s.sum(axis=1)
 
-        Xs = 2 *np.sqrt(np.einsum('ij,ik->ijk', y0s, y0s)) / y_k[:, None, None]
+        # evaluate 2 * sqrt(y_m * y_n) / y_k in place, in the requested order
+        Xs = np.empty(y0s.shape + y0s.shape[1:], dtype=np.result_type(y0s, np.complex64), order=order)
+        if np.all(y0s.real > 0):
+            # sqrt(y_m * y_n) = sqrt(y_m) * sqrt(y_n) on the right half-plane:
+            # take n square roots and a single outer product instead of n**2 of each
+            sqrt_y0s = np.sqrt(y0s)
+            np.multiply((sqrt_y0s * (2 / y_k[:, None]))[:, :, None], sqrt_y0s[:, None, :], out=Xs)
+        else:
+            np.multiply(y0s[:, :, None], y0s[:, None, :], out=Xs)
+            np.sqrt(Xs, out=Xs)
+            Xs *= 2 / y_k[:, None, None]
         np.einsum('kii->ki', Xs)[:] -= 1  # Sii
         return Xs
 
@@ -945,13 +977,18 @@ class Circuit:
           order is a bottleneck. Numpy generally optimizes operators for 'C' order, which
           lead to performance issues when using 'F' order.
         """
-        Xks = [self._Xk(cnx, order) for cnx in self.connections]
+        Xf = np.zeros((len(self.frequency), self.dim, self.dim), dtype=self.dtype, order=order)
+        y0s = (1 / self._connections_z0).astype(self.dtype, copy=False)
 
-        Xf = np.zeros((len(self.frequency), self.dim, self.dim), dtype='complex', order=order)
-        off = np.array([0, 0])
-        for Xk in Xks:
-            Xf[:, off[0]:off[0] + Xk.shape[1], off[1]:off[1]+Xk.shape[2]] = Xk
-            off += Xk.shape[1:]
+        # total admittance of all the intersections at once, shape f x nb_inter
+        cnx_size = [len(cnx) for cnx in self.connections]
+        starts = np.cumsum([0] + cnx_size[:-1])
+        y_ks = np.add.reduceat(y0s, starts, axis=1)
+
+        # scatter each [X]_k into its diagonal block as soon as it is computed
+        for k, (start, size) in enumerate(zip(starts, cnx_size)):
+            block = slice(start, start + size)
+            Xf[:, block, block] = self._Xk_y0(y0s[:, block], order, y_ks[:, k])
 
         return Xf
 
@@ -1066,7 +1103,7 @@ class Circuit:
                 ntws_ports_reordering[ntw.name].append([ntw_port, idx_cnx])
 
         # re-ordering scattering parameters
-        S = np.zeros((len(self.frequency), self.dim, self.dim), dtype='complex', order=order)
+        S = np.zeros((len(self.frequency), self.dim, self.dim), dtype=self.dtype, order=order)
 
         for (ntw_name, ntw_ports) in ntws_ports_reordering.items():
             # get the port re-ordering indexes (from -> to)
@@ -1076,8 +1113,8 @@ class Circuit:
             from_port = ntw_ports[:,0]
             to_port = ntw_ports[:,1]
 
-            for (_from, _to) in zip(from_port, to_port):
-                S[:, _to, to_port] = ntws[ntw_name].s_traveling[:, _from, from_port]
+            # scatter all the permuted s-parameters of the network at once
+            S[:, to_port[:, None], to_port] = ntws[ntw_name].s_traveling[:, from_port[:, None], from_port]
 
         return S  # shape (nb_frequency, nb_inter*nb_n, nb_inter*nb_n)
 
@@ -1091,33 +1128,28 @@ class Circuit:
         -------
         T : :class:`numpy.ndarray`
             Multiplication of the global scattering matrix [C] and concatenated intersection matrix
-            [X] of the networks. In practice, F-contiguous [C_F] and [X_F] are used.
+            [X] of the networks, F-contiguous.
             Shape `f x (nb_inter*nb_n) x (nb_inter*nb_n)`
 
         Note
         ----
-        This is an auxiliary matrix used to break the numerical bottleneck of [C_F] @ [X_F] using the
-        mathematical feature of block diagonal matrice [X].
+        This is an auxiliary matrix used to break the numerical bottleneck of [C] @ [X] using the
+        block sparsity of [C]: each network only contributes the block of its own ports.
         """
-        X, C = self.X_F, self.C_F
+        X, C = self.X, self.C
 
-        # T will be fully updated, so `empty_like` is safe and faster
-        T = np.empty_like(X, dtype="complex", order='F')
-
-        # Precompute the sizes of connections and slices for each intersection
-        cnx_size = [len(cnx) for cnx in self.connections]
-        slice_ = np.cumsum([0] + cnx_size)
-        slices = [slice(slice_[i], slice_[i+1]) for i in range(len(cnx_size))]
+        # [C] only couples the ports of a same network, so the rows of [T]
+        # belonging to a network only involve its diagonal block of [C].
+        # Rows of "port" networks are null in [C] and stay null in [T].
+        ntws_rows = {}
+        for (idx_cnx, (ntw, _)) in self.connections_list:
+            if not Circuit._is_port(ntw):
+                ntws_rows.setdefault(ntw.name, []).append(idx_cnx)
 
-        # Perform the multiplication
-        for j_slice in slices:
-            # Get the Block diagonal part of X and corresponding C matrix buffer
-            X_jj = - X[:, j_slice, j_slice]
-            C_j = C[:, :, j_slice]
-
-            # Perform the multiplication
-            for i_slice in slices:
-                T[:, i_slice, j_slice] = C_j[:, i_slice, :] @ X_jj
+        T = np.zeros_like(X, order='F')
+        for rows in ntws_rows.values():
+            rows = np.array(rows)
+            T[:, rows, :] = - C[:, rows[:, None], rows] @ X[:, rows, :]
 
         return T
 
@@ -1133,10 +1165,13 @@ class Circuit:
         S : :class:`numpy.ndarray`
             global scattering parameters of the circuit.
         """
+        # [S] = [X] @ inv([I] - [C] @ [X]) is computed as the transpose of a
+        # linear solve instead of forming the inverse
         X = self.X
-        return X @ np.linalg.inv(np.identity(self.dim) - self.C @ X)
+        A = np.identity(self.dim, dtype=self.dtype) - self.C @ X
+        return np.linalg.solve(A.swapaxes(1, 2), X.swapaxes(1, 2)).swapaxes(1, 2)
 
-    @property
+    @cached_property
     def port_indexes(self) -> list[int]:
         """
         Return the indexes of the "external" ports.
@@ -1145,11 +1180,22 @@ class Circuit:
         -------
         port_indexes : list
         """
-        port_indexes = []
-        for (idx_cnx, (ntw, _)) in enumerate(chain.from_iterable(self.connections)):
-            if Circuit._is_port(ntw):
-                port_indexes.append(idx_cnx)
-        return port_indexes
+        return [idx_cnx for (idx_cnx, (ntw, _)) in self.connections_list
+                if Circuit._is_port(ntw)]
+
+    @cached_property
+    def _connections_z0(self) -> np.ndarray:
+        """
+        Return the characteristic impedances of all the connections, in the
+        order of :func:`connections_list`.
+
+        Returns
+        -------
+        z0s : :class:`numpy.ndarray`
+            shape `f x dim`
+        """
+        return np.stack([ntw.z0[:, ntw_port] for (_, (ntw, ntw_port)) in self.connections_list],
+                        axis=1)
 
     def _cnx_z0(self, cnx_k: list[tuple]) -> np.ndarray:
         """
@@ -1165,13 +1211,11 @@ class Circuit:
         z0s : :class:`numpy.ndarray`
             shape `f x nb_ports_at_cnx`
         """
-        z0s = []
-        for (ntw, ntw_port) in cnx_k:
-            z0s.append(ntw.z0[:,ntw_port])
-
-        return np.array(z0s).T  # shape (nb_freq, nb_ports_at_cnx)
+        # stacking along the last axis directly gives a C-contiguous array
+        return np.stack([ntw.z0[:, ntw_port] for (ntw, ntw_port) in cnx_k],
+                        axis=1)  # shape (nb_freq, nb_ports_at_cnx)
 
-    @property
+    @cached_property
     def port_z0(self) -> np.ndarray:
         """
         Return the external port impedances.
@@ -1181,12 +1225,74 @@ class Circuit:
         z0s : :class:`numpy.ndarray`
             shape `f x nb_ports`
         """
-        z0s = []
-        for cnx in self.connections:
-            for (ntw, ntw_port) in cnx:
-                z0s.append(ntw.z0[:,ntw_port])
+        return self._connections_z0[:, self.port_indexes]  # shape (nb_freq, nb_ports)
+
+    @cached_property
+    def _cascade(self) -> list[tuple[Network, bool]] | None:
+        """
+        Return the 2-port networks of the circuit in cascade order, if the circuit is a plain cascade.
+
+        A plain cascade has two 1-port ports, only 2-port networks whose both ports are
+        connected, and intersections of two ports sharing the same characteristic impedance.
+
+        Returns
+        -------
+        cascade : list of tuples or None
+            (network, flipped) tuples from the first to the second port, `flipped` being True
+            when the network is entered from its second port. None if the circuit is not a cascade.
+        """
+        if any(len(cnx) != 2 for cnx in self.connections):
+            return None
 
-        return np.array(z0s)[self.port_indexes, :].T  # shape (nb_freq, nb_ports)
+        ntws = self._networks.values()
+        ports = [ntw for ntw in ntws if Circuit._is_port(ntw)]
+        if len(ports) != 2 or any(ntw.nports != (1 if Circuit._is_port(ntw) else 2) for ntw in ntws):
+            return None
+        if 2 * len(ntws) - 2 != 2 * self.connections_nb:
+            # some ports are left unconnected (matched)
+            return None
+
+        # the other side of each (network name, port) pair
+        peers = {}
+        for (ntw_a, port_a), (ntw_b, port_b) in self.connections:
+            if not np.array_equal(ntw_a.z0[:, port_a], ntw_b.z0[:, port_b]):
+                return None
+            peers[ntw_a.name, port_a] = (ntw_b, port_b)
+            peers[ntw_b.name, port_b] = (ntw_a, port_a)
+
+        # walk from the first port to the second one
+        cascade = []
+        ntw, port = peers[ports[0].name, 0]
+        while not Circuit._is_port(ntw):
+            cascade.append((ntw, port == 1))
+            ntw, port = peers[ntw.name, 1 - port]
+
+        # no network between the ports, or a loop of networks not reached from them
+        return cascade if 0 < len(cascade) == len(ntws) - 2 else None
+
+    def _s_external_cascade(self, cascade: list[tuple[Network, bool]]) -> np.ndarray:
+        """
+        Return the external scattering parameters of a plain cascade. See :func:`_cascade`.
+
+        The networks are combined two at a time with the 2-port star product, which is
+        O(f) per network instead of solving the `dim x dim` circuit system.
+        """
+        s = None
+        for ntw, flipped in cascade:
+            s_b = ntw.s_traveling[:, ::-1, ::-1] if flipped else ntw.s_traveling
+            if s is None:
+                s = s_b.astype(self.dtype)
+                continue
+            # accumulate the star product in place, each entry being read before it is updated
+            b11, b12, b21, b22 = s_b[:, 0, 0], s_b[:, 0, 1], s_b[:, 1, 0], s_b[:, 1, 1]
+            d = 1 / (1 - s[:, 1, 1] * b11)
+            a21d = s[:, 1, 0] * d
+            s[:, 0, 0] += s[:, 0, 1] * b11 * a21d
+            s[:, 1, 1] = b22 + b21 * b12 * d * s[:, 1, 1]
+            s[:, 0, 1] *= b12 * d
+            s[:, 1, 0] = b21 * a21d
+
+        return s2s(s, self.port_z0, S_DEF_DEFAULT, 'traveling')
 
     @property
     def s_external(self) -> np.ndarray:
@@ -1200,35 +1306,26 @@ class Circuit:
             Shape `f x nb_ports x nb_ports`
         """
         # The external S-matrix is the submatrix corresponding to external ports:
-        # port_indexes = self.port_indexes
-        # a, b = np.meshgrid(port_indexes, port_indexes, indexing='ij')
-        # S_ext = self.s[:, a, b]
+        # ext = np.array(self.port_indexes)
+        # S_ext = self.s[:, ext[:, None], ext]
+
+        # A plain cascade of 2-port networks reduces to 2-port star products
+        cascade = self._cascade
+        if cascade is not None:
+            return self._s_external_cascade(cascade)
 
         # Instead of calculating all S-parameters and taking a submatrix,
         # the following faster approach only calculates external the S-parameters
         # from block-matrix operations.
-        # generate index lists of internal and external ports
-        port_indexes = self.port_indexes
-        in_idxs = [(i,) for i in range(self.dim) if i not in port_indexes]
-        ext_idxs = [(i,) for i in port_indexes]
-        ext_l, in_l = len(ext_idxs), len(in_idxs)
-
-        # generate index slices for each sub-matrices
-        idx_a, idx_b, idx_c, idx_d = (
-            np.repeat(i, l, axis=1)
-            for i, l in (
-                (ext_idxs, ext_l),
-                (ext_idxs, in_l),
-                (in_idxs, ext_l),
-                (in_idxs, in_l),
-            )
-        )
+        # generate index arrays of external and internal ports
+        ext_idxs = np.array(self.port_indexes, dtype=int)
+        in_idxs = np.setdiff1d(np.arange(self.dim), ext_idxs)
 
-        # sub-matrices index, Matrix = [[A, B], [C, D]]]
-        A_idx = (slice(None), idx_a, idx_a.T)
-        B_idx = (slice(None), idx_b, idx_c.T)
-        C_idx = (slice(None), idx_c, idx_b.T)
-        D_idx = (slice(None), idx_d, idx_d.T)
+        # sub-matrices open-mesh indexes (as np.ix_), Matrix = [[A, B], [C, D]]]
+        A_idx = (slice(None), ext_idxs[:, None], ext_idxs)
+        B_idx = (slice(None), ext_idxs[:, None], in_idxs)
+        C_idx = (slice(None), in_idxs[:, None], ext_idxs)
+        D_idx = (slice(None), in_idxs[:, None], in_idxs)
 
         # Get the buffer of global matrix in f-order [X_T] and intermediate temporary matrix [T]
         # [T] = - [C] @ [X]
@@ -1398,10 +1495,8 @@ class Circuit:
             Characteristic impedances of both "inner" and "outer" ports
 
         """
-        z0s = []
-        for _cnx_idx, (ntw, ntw_port) in self.connections_list:
-            z0s.append(ntw.z0[:,ntw_port])
-        return np.array(z0s).T
+        # copy the cached table, which is shared with port_z0 and [X]
+        return self._connections_z0.copy()
 
     @property
     def connections_pair(self) -> list:
@@ -1886,7 +1981,7 @@ def reduce_circuit(connections: list[list[tuple[Network, int]]],
             splitter = _media.splitter(
                 name=f"Splt_{'&'.join(ntwk.name for ntwk, _ in cnx)}",
                 nports=len(cnx),
-                z0=np.array([ntwk.z0[:, p] for ntwk, p in cnx]).T
+                z0=np.stack([ntwk.z0[:, p] for ntwk, p in cnx], axis=1)
             )
 
             # Connect the splitter to the connection
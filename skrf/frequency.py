@@ -279,6 +279,8 @@ class Frequency:
     def __eq__(self, other: object) -> bool:
         #return (list(self.f) == list(other.f))
         # had to do this out of practicality
+        if other is self:
+            return True
         if not isinstance(other, self.__class__):
             return False
         if len(self.f) != len(other.f):
@@ -286,7 +288,7 @@ class Frequency:
         elif len(self.f) == len(other.f) == 0:
             return True
         else:
-            return (max(abs(self.f-other.f)) < ZERO)
+            return bool(np.max(np.abs(self.f - other.f)) < ZERO)
 
     def __ne__(self,other: object) -> bool:
         return (not self.__eq__(other))
@@ -1292,6 +1292,26 @@ def rsolve(A: np.ndarray, B: np.ndarray) -> np.ndarray:
     return np.transpose(np.linalg.solve(np.transpose(A, (0, 2, 1)).conj(),
             np.transpose(B, (0, 2, 1)).conj()), (0, 2, 1)).conj()
 
+def _eig2x2_above(mat: np.ndarray, cond: float, min_eig: float) -> bool:
+    """
+    Check if all eigenvalues of 2x2 matrices are clearly above the nudge limit.
+
+    The eigenvalues are computed in closed form, which is much faster than
+    `np.linalg.eig` for many small matrices. A safety margin covers their
+    rounding errors, borderline cases return False.
+    """
+    a, b, c, d = mat[:, 0, 0], mat[:, 0, 1], mat[:, 1, 0], mat[:, 1, 1]
+    tr = a + d
+    ad, bc = a * d, b * c
+    sq = np.sqrt((a - d)**2 + 4 * bc)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # larger eigenvalue without cancellation, smaller one from the determinant
+        eig1 = np.abs(tr + np.where(real(np.conj(tr) * sq) >= 0, sq, -sq)) / 2
+        eig2 = np.abs(ad - bc) / eig1
+        err = 1e-12 * (np.abs(ad) + np.abs(bc)) / eig1
+        limit = np.maximum(cond * np.maximum(eig1, eig2), min_eig)
+        return bool(np.all(np.minimum(eig1, eig2) >= 2 * limit + err))
+
 def nudge_eig(mat: np.ndarray,
               cond: float | None = None,
               min_eig: float | None  = None) -> np.ndarray:
@@ -1322,6 +1342,10 @@ def nudge_eig(mat: np.ndarray,
     if not min_eig:
         min_eig = EIG_MIN
 
+    if mat.shape[-1] == 2 and _eig2x2_above(mat, cond, min_eig):
+        # Nothing to do. Return the original array.
+        return mat
+
     # Eigenvalues and vectors
     eigw, eigv = np.linalg.eig(mat)
     # Max eigenvalue for each frequency
@@ -176,6 +176,39 @@ class CircuitTestConstructor(unittest.TestCase):
         self.assertTrue(self.circuit.X.flags['C_CONTIGUOUS'])
         self.assertTrue(self.circuit.X_F.flags['F_CONTIGUOUS'])
 
+    def test_single_precision(self):
+        """
+        Test the circuit matrices in single precision
+        """
+        circuit = rf.Circuit(self.connections, dtype=np.complex64)
+        for attr in ('X', 'C', 'T', 's'):
+            self.assertEqual(getattr(circuit, attr).dtype, np.complex64)
+        assert_array_almost_equal(circuit.s_external, self.circuit.s_external, decimal=5)
+
+        with self.assertRaises(ValueError):
+            rf.Circuit(self.connections, dtype=float)
+
+    def test_cascade(self):
+        """
+        Test the 2-port cascade path of s_external against the generic one
+        """
+        ntwk2_flipped = self.ntwk2.flipped()
+        ntwk2_flipped.name = 'ntwk2_flipped'
+        connections = [[(self.port1, 0), (self.ntwk1, 0)],
+                       [(self.ntwk1, 1), (ntwk2_flipped, 1)],
+                       [(ntwk2_flipped, 0), (self.port2, 0)]]
+        circuit = rf.Circuit(connections)
+        self.assertEqual(circuit._cascade, [(self.ntwk1, False), (ntwk2_flipped, True)])
+        assert_array_almost_equal(circuit.s_external, self.circuit.s_external)
+
+        generic = rf.Circuit(connections)
+        generic.__dict__['_cascade'] = None
+        assert_array_almost_equal(circuit.s_external, generic.s_external)
+
+        # an unconnected port is not a cascade
+        circuit = rf.Circuit([[(self.port1, 0), (self.ntwk1, 0)]])
+        self.assertIsNone(circuit._cascade)
+
 class CircuitClassMethods(unittest.TestCase):
     """
     Test the various class methods of Circuit such as Ground, Port, etc.
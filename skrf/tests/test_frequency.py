@@ -85,6 +85,16 @@ class FrequencyTestCase(unittest.TestCase):
         with self.assertRaises(AttributeError):
             a.stop = 10
 
+    def test_equality(self):
+        a = rf.Frequency(1, 10, 10, "GHz")
+        self.assertTrue(a == a)
+        self.assertTrue(a == a.copy())
+        self.assertFalse(a != a.copy())
+        self.assertFalse(a == rf.Frequency(1, 10, 11, "GHz"))
+        self.assertFalse(a == rf.Frequency(1, 11, 10, "GHz"))
+        self.assertFalse(a == a.f)
+        self.assertTrue(rf.Frequency.from_f([], unit="Hz") == rf.Frequency.from_f([], unit="Hz"))
+
     def test_frequency_math(self):
         from operator import add, floordiv, mod, mul, sub, truediv
 
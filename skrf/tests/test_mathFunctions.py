@@ -6,7 +6,7 @@ from numpy import inf, isnan, log, pi
 from numpy.testing import assert_almost_equal, assert_equal
 
 import skrf as rf
-from skrf.constants import EIG_MIN
+from skrf.constants import EIG_COND, EIG_MIN
 from skrf.mathFunctions import LOG_OF_NEG
 
 
@@ -199,6 +199,19 @@ class TestUnitConversions(unittest.TestCase):
         A2 = rf.nudge_eig(A)
         self.assertTrue(A is A2)
 
+    def test_nudge_eig_2x2(self):
+        rng = np.random.default_rng(0)
+        A = rng.random((10, 2, 2)) + 1j*rng.random((10, 2, 2))
+        self.assertTrue(rf.nudge_eig(A) is A)
+
+        # one singular and one non-normal, nearly singular matrix
+        A[3] = [[1, 1j], [1, 1j]]
+        A[5] = [[1e-11, 1e6], [0, 1]]
+        A2 = rf.nudge_eig(A)
+        self.assertFalse(A is A2)
+        eigw = np.abs(np.linalg.eigvals(A2))
+        self.assertTrue(np.all(eigw >= 0.99 * EIG_COND * np.max(eigw, axis=1)[:, None]))
+
     def test_nudge_default_params(self):
         "Test default params and passing different optional params"
         # check that Minimum eigenvalue is correctly passed